@@ -2,10 +2,12 @@
 Flask API for Attendance Dashboard
 Provides endpoints for CAPTCHA fetching and attendance scraping
 """
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import requests
 import base64
+import hashlib
+import json
 import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -14,7 +16,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=["ETag", "X-Captcha-Url"])
+
+# Opt-in compact format for /api/attendance, selected via the Accept header
+COLUMNAR_MIMETYPE = "application/vnd.attendance.columnar+json"
+
+
+def attendance_etag(records, mimetype="application/json"):
+    """Strong ETag derived from the attendance records and response format"""
+    payload = json.dumps(records, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(f"{mimetype}\n{payload}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def to_columnar(records):
+    """Convert attendance records into parallel arrays (one entry per subject)"""
+    return {
+        "codes": [r['Subject Code'] for r in records],
+        "names": [r['Subject Name'] for r in records],
+        "present": [r['Classes Present'] for r in records],
+        "absent": [r['Classes Absent'] for r in records],
+        "total": [r['Total Classes'] for r in records],
+    }
 
 
 @app.route('/', methods=['GET'])
@@ -25,8 +48,8 @@ def home():
         "version": "2.0",
         "endpoints": {
             "GET /api/health": "Health check",
-            "POST /api/captcha": "Get CAPTCHA image",
-            "POST /api/attendance": "Get attendance with CAPTCHA"
+            "POST /api/captcha": "Get CAPTCHA image (Accept: image/jpeg for raw bytes)",
+            "POST /api/attendance": f"Get attendance with CAPTCHA (Accept: {COLUMNAR_MIMETYPE} for columnar)"
         }
     })
 
@@ -53,6 +76,9 @@ def get_captcha():
         "captcha_url": "https://www.imsnsit.org/imsnsit/images/captcha/captcha_1770243588.jpg",
         "captcha_base64": "data:image/jpeg;base64,..."
     }
+    
+    With "Accept: image/jpeg" the raw image bytes are returned instead,
+    and the CAPTCHA URL is sent in the X-Captcha-Url header.
     """
     try:
         data = request.get_json()
@@ -111,16 +137,28 @@ def get_captcha():
                 session.cookies.set(cookie['name'], cookie['value'])
             
             img_response = session.get(captcha_url)
-            img_base64 = base64.b64encode(img_response.content).decode('utf-8')
             
             driver.quit()
             
-            return jsonify({
+            # Raw image is ~25% smaller than the base64 JSON variant
+            best = request.accept_mimetypes.best_match(["application/json", "image/jpeg"])
+            if best == "image/jpeg":
+                response = Response(img_response.content, mimetype="image/jpeg")
+                response.headers["X-Captcha-Url"] = captcha_url
+                response.headers["Cache-Control"] = "no-store"
+                response.vary.add("Accept")
+                return response
+            
+            img_base64 = base64.b64encode(img_response.content).decode('utf-8')
+            
+            response = jsonify({
                 "success": True,
                 "captcha_url": captcha_url,
                 "captcha_base64": f"data:image/jpeg;base64,{img_base64}",
                 "roll_no": roll_no
-            }), 200
+            })
+            response.vary.add("Accept")
+            return response
             
         except Exception as e:
             driver.quit()
@@ -154,6 +192,18 @@ def get_attendance():
         "data": [...attendance records...],
         "total_subjects": 6
     }
+    
+    Successful responses carry an ETag derived from the attendance data;
+    a matching If-None-Match header yields 304 with an empty body.
+    
+    With "Accept: application/vnd.attendance.columnar+json" the records are
+    sent as parallel arrays instead:
+    {
+        "success": true,
+        "format": "columnar",
+        "data": {"codes": [...], "names": [...], "present": [...], "absent": [...], "total": [...]},
+        "total_subjects": 6
+    }
     """
     try:
         # Import here to avoid circular imports
@@ -190,7 +240,29 @@ def get_attendance():
             headless=False  # Keep visible for debugging
         )
         
-        return jsonify(result), 200 if result['success'] else 500
+        if not result['success']:
+            return jsonify(result), 500
+        
+        best = request.accept_mimetypes.best_match(["application/json", COLUMNAR_MIMETYPE])
+        etag = attendance_etag(result['data'], best or "application/json")
+        
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        elif best == COLUMNAR_MIMETYPE:
+            response = jsonify({
+                "success": True,
+                "format": "columnar",
+                "data": to_columnar(result['data']),
+                "total_subjects": result['total_subjects']
+            })
+            response.mimetype = COLUMNAR_MIMETYPE
+        else:
+            response = jsonify(result)
+        
+        response.set_etag(etag)
+        response.vary.add("Accept")
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
         
     except Exception as e:
         print(f"❌ Error: {e}")
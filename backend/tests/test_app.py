@@ -0,0 +1,169 @@
+"""
+Tests for the Flask API (conditional GET, ETags and content negotiation)
+Scraper, browser and HTTP session are stubbed - no Chrome or network needed
+"""
+import os
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api import app as app_module  # noqa: E402
+
+
+RECORDS = [
+    {
+        'Subject Code': 'CS101',
+        'Subject Name': 'Programming',
+        'Classes Present': 20,
+        'Classes Absent': 5,
+        'Total Classes': 25,
+        'Attendance %': 80.0
+    },
+    {
+        'Subject Code': 'MA102',
+        'Subject Name': 'Mathematics',
+        'Classes Present': 15,
+        'Classes Absent': 5,
+        'Total Classes': 20,
+        'Attendance %': 75.0
+    },
+]
+
+CREDENTIALS = {"roll_no": "202300123", "password": "pw", "captcha": "abc123"}
+
+
+@pytest.fixture
+def client():
+    app_module.app.config['TESTING'] = True
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def scrape_result(monkeypatch):
+    """Stub scraper.scraper so /api/attendance returns whatever the test sets"""
+    result = {'success': True, 'data': RECORDS, 'total_subjects': len(RECORDS)}
+    stub = types.ModuleType('scraper.scraper')
+    stub.scrape_attendance = lambda **kwargs: result
+    monkeypatch.setitem(sys.modules, 'scraper.scraper', stub)
+    return result
+
+
+@pytest.fixture
+def captcha_browser(monkeypatch):
+    """Stub Chrome and the requests session used by /api/captcha"""
+    driver = mock.MagicMock()
+    driver.find_element.return_value.get_attribute.return_value = "images/captcha/captcha_1.jpg"
+    driver.get_cookies.return_value = []
+    monkeypatch.setattr(app_module.webdriver, 'Chrome', lambda options=None: driver)
+    monkeypatch.setattr(app_module, 'WebDriverWait', mock.MagicMock())
+    monkeypatch.setattr(app_module.time, 'sleep', lambda seconds: None)
+
+    session = mock.MagicMock()
+    session.get.return_value.content = b'\xff\xd8\xffJPEGDATA'
+    monkeypatch.setattr(app_module.requests, 'Session', lambda: session)
+    return session
+
+
+def test_attendance_default_is_legacy_json(client, scrape_result):
+    for headers in ({}, {"Accept": "*/*"}):
+        response = client.post('/api/attendance', json=CREDENTIALS, headers=headers)
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == scrape_result
+        assert response.headers['ETag']
+
+
+def test_attendance_columnar_format(client, scrape_result):
+    response = client.post('/api/attendance', json=CREDENTIALS,
+                           headers={"Accept": app_module.COLUMNAR_MIMETYPE})
+    
+    assert response.status_code == 200
+    assert response.mimetype == app_module.COLUMNAR_MIMETYPE
+    assert response.get_json() == {
+        "success": True,
+        "format": "columnar",
+        "data": {
+            "codes": ['CS101', 'MA102'],
+            "names": ['Programming', 'Mathematics'],
+            "present": [20, 15],
+            "absent": [5, 5],
+            "total": [25, 20],
+        },
+        "total_subjects": 2
+    }
+    assert 'Accept' in response.headers['Vary']
+
+
+def test_formats_have_different_etags(client, scrape_result):
+    json_response = client.post('/api/attendance', json=CREDENTIALS)
+    columnar_response = client.post('/api/attendance', json=CREDENTIALS,
+                                    headers={"Accept": app_module.COLUMNAR_MIMETYPE})
+    
+    assert json_response.headers['ETag'] != columnar_response.headers['ETag']
+
+
+def test_matching_if_none_match_returns_304(client, scrape_result):
+    etag = client.post('/api/attendance', json=CREDENTIALS).headers['ETag']
+    
+    response = client.post('/api/attendance', json=CREDENTIALS,
+                           headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+
+def test_weak_if_none_match_returns_304(client, scrape_result):
+    etag = client.post('/api/attendance', json=CREDENTIALS).headers['ETag']
+    
+    response = client.post('/api/attendance', json=CREDENTIALS,
+                           headers={"If-None-Match": f"W/{etag}"})
+    
+    assert response.status_code == 304
+
+
+def test_changed_data_does_not_match(client, scrape_result):
+    etag = client.post('/api/attendance', json=CREDENTIALS).headers['ETag']
+    scrape_result['data'] = RECORDS[:1]
+    
+    response = client.post('/api/attendance', json=CREDENTIALS,
+                           headers={"If-None-Match": etag})
+    
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_failed_scrape_returns_500_without_etag(client, scrape_result):
+    scrape_result.clear()
+    scrape_result.update({'success': False, 'error': 'No attendance data found'})
+    
+    response = client.post('/api/attendance', json=CREDENTIALS)
+    
+    assert response.status_code == 500
+    assert 'ETag' not in response.headers
+    assert response.get_json()['success'] is False
+
+
+def test_captcha_default_is_base64_json(client, captcha_browser):
+    response = client.post('/api/captcha', json={"roll_no": "202300123"})
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is True
+    assert body['captcha_base64'].startswith('data:image/jpeg;base64,')
+
+
+def test_captcha_raw_jpeg(client, captcha_browser):
+    response = client.post('/api/captcha', json={"roll_no": "202300123"},
+                           headers={"Accept": "image/jpeg"})
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'image/jpeg'
+    assert response.data == b'\xff\xd8\xffJPEGDATA'
+    assert response.headers['X-Captcha-Url'] == \
+        "https://www.imsnsit.org/imsnsit/images/captcha/captcha_1.jpg"
@@ -1,9 +1,10 @@
 // src/App.js
 
-import React, { useState } from "react";
+import React, { useEffect, useState } from "react";
 import "./App.css";
 import LoginForm from "./components/LoginForm";
 import Dashboard from "./components/Dashboard";
+import { clearAttendanceCache, getLastAttendance } from "./services/cache";
 
 function App() {
   // STATE - Controls what the app shows and stores data
@@ -14,12 +15,33 @@ function App() {
   // Attendance data from backend (array of subjects)
   const [attendanceData, setAttendanceData] = useState([]);
 
+  // When the attendance data was fetched from the backend (ms timestamp)
+  const [lastUpdated, setLastUpdated] = useState(null);
+
+  // On first load, show the last cached attendance instantly (no scrape)
+  useEffect(() => {
+    let cancelled = false;
+
+    getLastAttendance().then((entry) => {
+      if (entry && !cancelled) {
+        setAttendanceData(entry.data);
+        setLastUpdated(entry.fetchedAt);
+        setIsLoggedIn(true);
+      }
+    });
+
+    return () => {
+      cancelled = true;
+    };
+  }, []);
+
   // FUNCTION 1: Called when login is successful
-  const handleLoginSuccess = (data) => {
+  const handleLoginSuccess = (data, fetchedAt) => {
     console.log("Login successful! Received data:", data);
 
     // Store the attendance data in state
     setAttendanceData(data);
+    setLastUpdated(fetchedAt || Date.now());
 
     // Switch to logged-in mode
     setIsLoggedIn(true);
@@ -29,13 +51,20 @@ function App() {
   const handleLogout = () => {
     console.log("Logging out...");
 
-    // Clear the data
+    // Clear the data (including the offline copy)
     setAttendanceData([]);
+    setLastUpdated(null);
+    clearAttendanceCache();
 
     // Go back to login screen
     setIsLoggedIn(false);
   };
 
+  // FUNCTION 3: Called when user wants newer data - keep the cache
+  const handleRefresh = () => {
+    setIsLoggedIn(false);
+  };
+
   // RENDER - Decide what to show
   return (
     <div className="App">
@@ -45,7 +74,12 @@ function App() {
         <LoginForm onLoginSuccess={handleLoginSuccess} />
       ) : (
         // Logged in → Show Dashboard
-        <Dashboard attendanceData={attendanceData} onLogout={handleLogout} />
+        <Dashboard
+          attendanceData={attendanceData}
+          lastUpdated={lastUpdated}
+          onRefresh={handleRefresh}
+          onLogout={handleLogout}
+        />
       )}
     </div>
   );
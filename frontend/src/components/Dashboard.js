@@ -1,8 +1,9 @@
 // src/components/Dashboard.js
 
 import React from "react";
+import { isStale } from "../services/cache";
 
-function Dashboard({ attendanceData, onLogout }) {
+function Dashboard({ attendanceData, lastUpdated, onRefresh, onLogout }) {
   // Calculate overall statistics
   const calculateStats = () => {
     if (!attendanceData || attendanceData.length === 0) {
@@ -49,6 +50,9 @@ function Dashboard({ attendanceData, onLogout }) {
     return "#dc3545"; // Red
   };
 
+  // Fresh data is reused as-is; only offer a refresh once it goes stale
+  const isOutdated = lastUpdated && isStale({ fetchedAt: lastUpdated });
+
   return (
     <div style={styles.container}>
       {/* Header with Logout */}
@@ -59,6 +63,18 @@ function Dashboard({ attendanceData, onLogout }) {
         </button>
       </div>
 
+      {/* Last updated / stale notice */}
+      {lastUpdated && (
+        <div style={isOutdated ? styles.staleNotice : styles.updatedNotice}>
+          Last updated: {new Date(lastUpdated).toLocaleString()}
+          {isOutdated && (
+            <button onClick={onRefresh} style={styles.refreshButton}>
+              🔄 Refresh
+            </button>
+          )}
+        </div>
+      )}
+
       {/* Statistics Cards */}
       <div style={styles.statsContainer}>
         <div style={styles.statCard}>
@@ -177,6 +193,30 @@ const styles = {
     cursor: "pointer",
     fontSize: "16px",
   },
+  updatedNotice: {
+    padding: "10px",
+    marginBottom: "20px",
+    color: "#666",
+    fontSize: "14px",
+  },
+  staleNotice: {
+    display: "flex",
+    justifyContent: "space-between",
+    alignItems: "center",
+    padding: "10px",
+    marginBottom: "20px",
+    backgroundColor: "#fff3cd",
+    color: "#856404",
+    borderRadius: "4px",
+  },
+  refreshButton: {
+    padding: "8px 16px",
+    backgroundColor: "#007bff",
+    color: "white",
+    border: "none",
+    borderRadius: "4px",
+    cursor: "pointer",
+  },
   statsContainer: {
     display: "grid",
     gridTemplateColumns: "repeat(3, 1fr)",
@@ -68,7 +68,7 @@ function LoginForm({ onLoginSuccess }) {
 
       if (response.success) {
         // Pass data to parent component (App.js)
-        onLoginSuccess(response.data);
+        onLoginSuccess(response.data, response.fetchedAt);
       } else {
         setError(response.error || "Failed to fetch attendance");
       }
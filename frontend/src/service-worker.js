@@ -0,0 +1,39 @@
+/* eslint-disable no-restricted-globals */
+
+// src/service-worker.js
+//
+// Precaches the app shell so repeat visits load without the network.
+// CRA compiles this file with Workbox's InjectManifest during `npm run build`
+// and fills in self.__WB_MANIFEST with the list of built assets.
+// API calls to the backend are never cached here - attendance is cached
+// in IndexedDB by src/services/cache.js instead.
+
+import { clientsClaim } from "workbox-core";
+import { ExpirationPlugin } from "workbox-expiration";
+import { createHandlerBoundToURL, precacheAndRoute } from "workbox-precaching";
+import { registerRoute } from "workbox-routing";
+import { StaleWhileRevalidate } from "workbox-strategies";
+
+clientsClaim();
+
+// Precache all built JS/CSS/HTML
+precacheAndRoute(self.__WB_MANIFEST);
+
+// Serve index.html for every page navigation (single page app)
+const fileExtensionRegexp = new RegExp("/[^/?]+\\.[^/]+$");
+registerRoute(({ request, url }) => {
+  if (request.mode !== "navigate") return false;
+  if (url.pathname.startsWith("/_")) return false;
+  if (url.pathname.match(fileExtensionRegexp)) return false;
+  return true;
+}, createHandlerBoundToURL(process.env.PUBLIC_URL + "/index.html"));
+
+// Same-origin images from /public (logos, favicon)
+registerRoute(
+  ({ url }) =>
+    url.origin === self.location.origin && url.pathname.endsWith(".png"),
+  new StaleWhileRevalidate({
+    cacheName: "images",
+    plugins: [new ExpirationPlugin({ maxEntries: 50 })],
+  })
+);
@@ -0,0 +1,32 @@
+// src/serviceWorkerRegistration.js
+
+/**
+ * Registers the service worker built from src/service-worker.js.
+ * Only runs in production builds - in development the worker would
+ * cache stale bundles and get in the way of hot reloading.
+ */
+
+export function register() {
+  if (process.env.NODE_ENV !== "production" || !("serviceWorker" in navigator)) {
+    return;
+  }
+
+  // Service worker won't work if PUBLIC_URL is on a different origin
+  const publicUrl = new URL(process.env.PUBLIC_URL, window.location.href);
+  if (publicUrl.origin !== window.location.origin) {
+    return;
+  }
+
+  window.addEventListener("load", () => {
+    const swUrl = `${process.env.PUBLIC_URL}/service-worker.js`;
+
+    navigator.serviceWorker
+      .register(swUrl)
+      .then((registration) => {
+        console.log("Service worker registered:", registration.scope);
+      })
+      .catch((error) => {
+        console.error("Error registering service worker:", error);
+      });
+  });
+}
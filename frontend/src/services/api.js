@@ -1,5 +1,7 @@
 // src/services/api.js
 
+import { attendanceKey, getCachedAttendance, saveAttendance } from "./cache";
+
 // Base URL of our Flask backend
 const API_BASE_URL = "http://localhost:5001";
 
@@ -7,8 +9,24 @@ const API_BASE_URL = "http://localhost:5001";
  * API Service - Functions to communicate with backend
  */
 
+// Requests currently in flight, keyed by what they fetch.
+// Every backend call starts a Chrome scrape, so a double click or a remount
+// must reuse the pending request instead of sending a new one.
+const inFlight = new Map();
+
+const dedupe = (key, request) => {
+  if (!inFlight.has(key)) {
+    const promise = request().finally(() => inFlight.delete(key));
+    inFlight.set(key, promise);
+  }
+  return inFlight.get(key);
+};
+
 // Function 1: Fetch CAPTCHA image
-export const fetchCaptcha = async (rollNo) => {
+export const fetchCaptcha = (rollNo) =>
+  dedupe(`captcha:${rollNo}`, () => requestCaptcha(rollNo));
+
+const requestCaptcha = async (rollNo) => {
   try {
     // Make a POST request to /api/captcha endpoint
     const response = await fetch(`${API_BASE_URL}/api/captcha`, {
@@ -31,13 +49,31 @@ export const fetchCaptcha = async (rollNo) => {
 };
 
 // Function 2: Fetch attendance data
-export const fetchAttendance = async (credentials) => {
+// Results are cached per (roll, year, semester); the cached ETag is sent back
+// so an unchanged result comes back as an empty 304.
+export const fetchAttendance = (credentials) => {
+  const key = attendanceKey(
+    credentials.rollNo,
+    credentials.year || 0,
+    credentials.semester || 0
+  );
+  return dedupe(`attendance:${key}`, () => requestAttendance(key, credentials));
+};
+
+const requestAttendance = async (key, credentials) => {
   try {
+    const cached = await getCachedAttendance(key);
+
+    const headers = {
+      "Content-Type": "application/json",
+    };
+    if (cached && cached.etag) {
+      headers["If-None-Match"] = cached.etag;
+    }
+
     const response = await fetch(`${API_BASE_URL}/api/attendance`, {
       method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-      },
+      headers,
       body: JSON.stringify({
         roll_no: credentials.rollNo,
         password: credentials.password,
@@ -47,7 +83,24 @@ export const fetchAttendance = async (credentials) => {
       }),
     });
 
+    // Unchanged since last time - reuse the cached records
+    if (response.status === 304 && cached) {
+      const entry = await saveAttendance(key, cached.data, cached.etag);
+      return {
+        success: true,
+        data: cached.data,
+        total_subjects: cached.data.length,
+        fetchedAt: entry ? entry.fetchedAt : Date.now(),
+      };
+    }
+
     const data = await response.json();
+
+    if (data.success) {
+      const entry = await saveAttendance(key, data.data, response.headers.get("ETag"));
+      data.fetchedAt = entry ? entry.fetchedAt : Date.now();
+    }
+
     return data;
   } catch (error) {
     console.error("Error fetching attendance:", error);
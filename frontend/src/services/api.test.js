@@ -0,0 +1,117 @@
+import { fetchAttendance, fetchCaptcha } from "./api";
+import { getCachedAttendance } from "./cache";
+
+// Keep the real cache (which falls back to null in jsdom) except for reads,
+// so tests can pretend a previous result is cached
+jest.mock("./cache", () => ({
+  ...jest.requireActual("./cache"),
+  getCachedAttendance: jest.fn(),
+}));
+
+const RECORDS = [
+  {
+    "Subject Code": "CS101",
+    "Subject Name": "Programming",
+    "Classes Present": 20,
+    "Classes Absent": 5,
+    "Total Classes": 25,
+    "Attendance %": 80,
+  },
+];
+
+const CREDENTIALS = {
+  rollNo: "202300123",
+  password: "password",
+  captcha: "abc123",
+};
+
+// Minimal stand-in for a fetch Response
+const jsonResponse = (body, status = 200, etag = null) => ({
+  status,
+  headers: { get: (name) => (name === "ETag" ? etag : null) },
+  json: async () => body,
+});
+
+beforeEach(() => {
+  global.fetch = jest.fn();
+  getCachedAttendance.mockResolvedValue(null);
+});
+
+test("concurrent fetchCaptcha calls share one request", async () => {
+  fetch.mockResolvedValue(jsonResponse({ success: true, captcha_base64: "img" }));
+
+  const [first, second] = await Promise.all([
+    fetchCaptcha("202300123"),
+    fetchCaptcha("202300123"),
+  ]);
+
+  expect(fetch).toHaveBeenCalledTimes(1);
+  expect(first).toBe(second);
+
+  // Once settled, the next call goes to the backend again
+  await fetchCaptcha("202300123");
+  expect(fetch).toHaveBeenCalledTimes(2);
+});
+
+test("concurrent fetchAttendance calls share one request", async () => {
+  fetch.mockResolvedValue(
+    jsonResponse({ success: true, data: RECORDS, total_subjects: 1 }, 200, '"v1"')
+  );
+
+  const [first, second] = await Promise.all([
+    fetchAttendance(CREDENTIALS),
+    fetchAttendance(CREDENTIALS),
+  ]);
+
+  expect(fetch).toHaveBeenCalledTimes(1);
+  expect(first).toBe(second);
+  expect(first.data).toEqual(RECORDS);
+
+  await fetchAttendance(CREDENTIALS);
+  expect(fetch).toHaveBeenCalledTimes(2);
+});
+
+test("fetchAttendance for different semesters is not deduplicated", async () => {
+  fetch.mockResolvedValue(
+    jsonResponse({ success: true, data: RECORDS, total_subjects: 1 })
+  );
+
+  await Promise.all([
+    fetchAttendance(CREDENTIALS),
+    fetchAttendance({ ...CREDENTIALS, semester: 1 }),
+  ]);
+
+  expect(fetch).toHaveBeenCalledTimes(2);
+});
+
+test("a 304 reuses cached records with a refreshed fetchedAt", async () => {
+  const oldFetchedAt = Date.now() - 60 * 60 * 1000;
+  getCachedAttendance.mockResolvedValue({
+    key: "202300123:0:0",
+    data: RECORDS,
+    etag: '"v1"',
+    fetchedAt: oldFetchedAt,
+  });
+  fetch.mockResolvedValue(jsonResponse(null, 304));
+
+  const result = await fetchAttendance(CREDENTIALS);
+
+  expect(fetch.mock.calls[0][1].headers["If-None-Match"]).toBe('"v1"');
+  expect(result).toEqual({
+    success: true,
+    data: RECORDS,
+    total_subjects: 1,
+    fetchedAt: expect.any(Number),
+  });
+  expect(result.fetchedAt).toBeGreaterThan(oldFetchedAt);
+});
+
+test("no If-None-Match is sent without a cached entry", async () => {
+  fetch.mockResolvedValue(
+    jsonResponse({ success: true, data: RECORDS, total_subjects: 1 })
+  );
+
+  await fetchAttendance(CREDENTIALS);
+
+  expect(fetch.mock.calls[0][1].headers).not.toHaveProperty("If-None-Match");
+});
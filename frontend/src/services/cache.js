@@ -0,0 +1,135 @@
+// src/services/cache.js
+
+/**
+ * Offline attendance cache - stores the last result per (roll, year, semester)
+ * in IndexedDB so the dashboard can render instantly on the next visit.
+ *
+ * Every function resolves to null (and never rejects) if IndexedDB is
+ * unavailable (private browsing, old browsers, tests) or a transaction fails,
+ * so callers never need a try/catch.
+ */
+
+const DB_NAME = "attendx";
+const DB_VERSION = 1;
+const STORE_NAME = "attendance";
+
+// Record id that remembers which entry was loaded most recently
+const LAST_KEY = "__last__";
+
+// Cached attendance older than this is considered stale (6 hours)
+export const ATTENDANCE_MAX_AGE_MS = 6 * 60 * 60 * 1000;
+
+let dbPromise = null;
+
+// Open (and create on first use) the database, reusing one connection
+const openDb = () => {
+  if (typeof indexedDB === "undefined") {
+    return Promise.resolve(null);
+  }
+
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      let request;
+      try {
+        request = indexedDB.open(DB_NAME, DB_VERSION);
+      } catch (error) {
+        // e.g. SecurityError when storage is disabled
+        console.error("Error opening attendance cache:", error);
+        resolve(null);
+        return;
+      }
+
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE_NAME);
+      };
+      request.onsuccess = () => {
+        const db = request.result;
+
+        // Another tab is upgrading the database - let it, and reopen next time
+        db.onversionchange = () => {
+          db.close();
+          dbPromise = null;
+        };
+        resolve(db);
+      };
+      request.onerror = () => {
+        console.error("Error opening attendance cache:", request.error);
+        dbPromise = null;
+        resolve(null);
+      };
+      // An older connection in another tab is blocking the upgrade
+      request.onblocked = () => {
+        console.error("Attendance cache is blocked by another tab");
+        dbPromise = null;
+        resolve(null);
+      };
+    });
+  }
+
+  return dbPromise;
+};
+
+// Run a single request against the store and resolve with its result,
+// or null if the transaction could not be started, failed or was aborted
+const runRequest = async (mode, makeRequest) => {
+  const db = await openDb();
+  if (!db) return null;
+
+  return new Promise((resolve) => {
+    const fail = (error) => {
+      console.error("Attendance cache error:", error);
+      resolve(null);
+    };
+
+    let request;
+    let tx;
+    try {
+      // Throws if the connection is closing (e.g. after a versionchange)
+      tx = db.transaction(STORE_NAME, mode);
+      request = makeRequest(tx.objectStore(STORE_NAME));
+    } catch (error) {
+      fail(error);
+      return;
+    }
+
+    tx.oncomplete = () => resolve(request.result ?? null);
+    // Failed requests abort the transaction, as do quota errors,
+    // so "abort" covers every way it can end without completing
+    tx.onabort = () => fail(tx.error);
+  });
+};
+
+// Build the cache key for one roll number / year / semester combination
+export const attendanceKey = (rollNo, year = 0, semester = 0) =>
+  `${rollNo}:${year}:${semester}`;
+
+// Is a cached entry missing or older than ATTENDANCE_MAX_AGE_MS?
+export const isStale = (entry) =>
+  !entry || Date.now() - entry.fetchedAt > ATTENDANCE_MAX_AGE_MS;
+
+// Get the cached entry { key, data, etag, fetchedAt } for a key
+export const getCachedAttendance = (key) =>
+  runRequest("readonly", (store) => store.get(key));
+
+// Save attendance for a key and remember it as the most recent entry.
+// Resolves to the stored entry, or null if nothing could be stored.
+export const saveAttendance = async (key, data, etag) => {
+  const entry = { key, data, etag, fetchedAt: Date.now() };
+
+  const stored = await runRequest("readwrite", (store) => {
+    store.put(key, LAST_KEY);
+    return store.put(entry, key);
+  });
+
+  return stored === null ? null : entry;
+};
+
+// Get the most recently saved entry (used to render instantly on load)
+export const getLastAttendance = async () => {
+  const key = await runRequest("readonly", (store) => store.get(LAST_KEY));
+  return key ? getCachedAttendance(key) : null;
+};
+
+// Remove every cached entry (called on logout)
+export const clearAttendanceCache = () =>
+  runRequest("readwrite", (store) => store.clear());
@@ -0,0 +1,39 @@
+import {
+  ATTENDANCE_MAX_AGE_MS,
+  attendanceKey,
+  clearAttendanceCache,
+  getCachedAttendance,
+  getLastAttendance,
+  isStale,
+  saveAttendance,
+} from "./cache";
+
+// jsdom has no IndexedDB, so these run against the fallback path
+test("jsdom has no indexedDB", () => {
+  expect(typeof indexedDB).toBe("undefined");
+});
+
+test("isStale treats missing entries as stale", () => {
+  expect(isStale(null)).toBe(true);
+  expect(isStale(undefined)).toBe(true);
+});
+
+test("isStale is false for fresh entries and true for expired ones", () => {
+  expect(isStale({ fetchedAt: Date.now() })).toBe(false);
+  expect(isStale({ fetchedAt: Date.now() - ATTENDANCE_MAX_AGE_MS + 1000 })).toBe(false);
+  expect(isStale({ fetchedAt: Date.now() - ATTENDANCE_MAX_AGE_MS - 1000 })).toBe(true);
+});
+
+test("attendanceKey defaults year and semester to 0", () => {
+  expect(attendanceKey("202300123")).toBe("202300123:0:0");
+  expect(attendanceKey("202300123", 1, 2)).toBe("202300123:1:2");
+});
+
+test("every cache function resolves to null without IndexedDB", async () => {
+  const key = attendanceKey("202300123");
+
+  await expect(saveAttendance(key, [], '"etag"')).resolves.toBeNull();
+  await expect(getCachedAttendance(key)).resolves.toBeNull();
+  await expect(getLastAttendance()).resolves.toBeNull();
+  await expect(clearAttendanceCache()).resolves.toBeNull();
+});